@@ -1,6 +1,7 @@
 # backend/app.py
-import os, glob, shlex, shutil, tempfile, subprocess
-from typing import List, Dict, Optional
+import os, glob, shlex, shutil, tempfile, subprocess, importlib.util, threading, logging
+from collections import OrderedDict
+from typing import List, Dict, Optional, Tuple
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
@@ -10,6 +11,16 @@ PROPS_ROOT   = os.environ.get(
     os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "docs"))
 )
 PROPS_SUBDIR = os.environ.get("PROPS_SUBDIR", "properties")  # <-- use 'properties'
+# plot_interactive.py is published next to the CdTe HLE17 12 Å data so it can be
+# run by hand; that copy is the canonical one and /plot/compare imports it.
+# Point PLOT_SCRIPT elsewhere if the docs tree is laid out differently.
+PLOT_SCRIPT  = os.environ.get(
+    "PLOT_SCRIPT",
+    os.path.join(PROPS_ROOT, "II-VI", "CdTe", "HLE17", "12ang", PROPS_SUBDIR, "plot_interactive.py")
+)
+if not os.path.isfile(PLOT_SCRIPT):
+    logging.getLogger("uvicorn.error").warning(
+        "PLOT_SCRIPT not found (%s): /plot/compare will return 500", PLOT_SCRIPT)
 
 class Job(BaseModel):
     ligands: List[str] = Field(..., min_items=1)
@@ -154,3 +165,123 @@ def plot_interactive(req: PlotRequest):
         "message": "OK",
     }
 
+
+class CompareRequest(BaseModel):
+    folders: List[str] = Field(..., min_items=1)
+    labels: Optional[List[str]] = None
+    pdos: str = "pdos_data.csv"
+    coop: str = "coop_data.csv"
+    ewin: Optional[Tuple[float, float]] = None
+    ef: Optional[float] = None
+    normalize_coop: bool = True
+    normalize_dos: bool = False
+    title: str = "Size series"
+
+_plotter = None
+_plotter_lock = threading.Lock()
+
+def _load_plotter():
+    """Import plot_interactive.py once so batch requests skip the subprocess start-up."""
+    global _plotter
+    with _plotter_lock:
+        if _plotter is None:
+            spec = importlib.util.spec_from_file_location("plot_interactive", PLOT_SCRIPT)
+            if spec is None or not os.path.isfile(PLOT_SCRIPT):
+                raise HTTPException(status_code=500, detail="plot_interactive.py not found (see PLOT_SCRIPT)")
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            _plotter = module
+    return _plotter
+
+def _stamp(path: str) -> Tuple[int, int]:
+    """(mtime_ns, size) of a file, (0, 0) if absent."""
+    if not os.path.isfile(path):
+        return (0, 0)
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size)
+
+# rendered comparison HTML, keyed by the request values plus input mtimes (LRU)
+COMPARE_CACHE_SIZE = 32
+_compare_cache: "OrderedDict[tuple, str]" = OrderedDict()
+_compare_lock = threading.Lock()
+
+def _render_comparison(folders, labels, pdos, coop, ewin, ef,
+                       normalize_coop, normalize_dos, title) -> str:
+    plotter = _load_plotter()
+    workdirs = [os.path.join(PROPS_ROOT, f, PROPS_SUBDIR) for f in folders]
+    structures = plotter.load_many(
+        workdirs, labels=labels,
+        pdos=pdos, coop=coop, ewin=ewin,
+    )
+    fig = plotter.build_comparison_figure(
+        structures, ewin=ewin, ef=ef,
+        normalize_coop=normalize_coop, normalize_dos=normalize_dos,
+        title=title,
+    )
+    return fig.to_html(include_plotlyjs="cdn", full_html=True)
+
+@app.post("/plot/compare")
+def plot_compare(req: CompareRequest):
+    """
+    Render PDOS + COOP of several <folder>/properties in one figure (shared
+    energy axis, per-structure toggles). Results are cached until an input changes.
+    """
+    if req.labels is not None and len(req.labels) != len(req.folders):
+        raise HTTPException(status_code=400, detail="labels must match folders one-to-one")
+    if req.ewin is not None and not req.ewin[0] < req.ewin[1]:
+        raise HTTPException(status_code=400, detail="ewin must be [emin, emax] with emin < emax")
+    for name in (req.pdos, req.coop):
+        # plain file names only: inputs must live in the properties folder itself
+        if not name or os.path.basename(name) != name or name in (".", ".."):
+            raise HTTPException(status_code=400, detail=f"Invalid input file name: {name!r}")
+    folders = []
+    stamps = []
+    for folder in req.folders:
+        base = os.path.normpath(os.path.join(PROPS_ROOT, folder or ""))
+        if not base.startswith(PROPS_ROOT + os.sep):
+            raise HTTPException(status_code=400, detail="Invalid folder path")
+        rel = os.path.relpath(base, PROPS_ROOT)
+        workdir = os.path.join(base, PROPS_SUBDIR)
+        if not os.path.isdir(workdir):
+            raise HTTPException(status_code=400, detail=f"'properties' folder not found in {rel}")
+        for name in (req.pdos, req.coop):
+            p = os.path.join(workdir, name)
+            if not os.path.isfile(p):
+                raise HTTPException(status_code=400, detail=f"Missing input file: {rel}/{PROPS_SUBDIR}/{name}")
+            # a rewritten column store changes what gets plotted, so it counts too
+            stamps += [_stamp(p), _stamp(os.path.splitext(p)[0] + ".cols.npz")]
+        folders.append(rel)
+
+    args = (
+        tuple(folders),
+        tuple(req.labels) if req.labels is not None else None,
+        req.pdos, req.coop,
+        tuple(req.ewin) if req.ewin is not None else None,
+        req.ef, req.normalize_coop, req.normalize_dos, req.title,
+    )
+    # input mtimes are only part of the key: edited data re-renders
+    key = args + (tuple(stamps),)
+
+    with _compare_lock:
+        html = _compare_cache.get(key)
+        if html is not None:
+            _compare_cache.move_to_end(key)
+    cached = html is not None
+
+    if not cached:
+        try:
+            html = _render_comparison(*args)
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"comparison failed: {e}")
+        with _compare_lock:
+            _compare_cache[key] = html
+            while len(_compare_cache) > COMPARE_CACHE_SIZE:
+                _compare_cache.popitem(last=False)
+
+    return {
+        "html": html,
+        "cached": cached,
+        "message": "OK",
+    }
@@ -15,9 +15,27 @@ Example:
       --out   fuzzy_pdos_coop_interactive.html \
       --normalize-coop \
       --ef 0.0
+
+Column stores (optional, faster for large systems):
+  python plot_interactive.py --convert .
+
+  writes <name>.cols.npz next to each input (uncompressed; float columns are
+  narrowed to float32, never widened).
+  The loaders memory-map a store when it was written from the current source
+  (same mtime and size) and read only the energy window being plotted;
+  otherwise they parse the CSV/npz.
+
+Size-series comparison (PDOS + COOP of several properties/ folders; no fuzzy panel):
+  python plot_interactive.py \
+      --compare ../../12ang/properties ../../20ang/properties ../../28ang/properties \
+      --out size_series.html --normalize-coop --normalize-dos
 """
 
 import argparse
+import os
+import struct
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
@@ -26,39 +44,306 @@ from plotly.subplots import make_subplots
 
 # ----------------------------- I/O helpers -----------------------------
 
-def load_fuzzy(npz_path):
+# Column store written next to each input: pdos_data.csv -> pdos_data.cols.npz.
+# Uncompressed npz members are plain .npy blobs, so they can be memory-mapped
+# straight out of the archive and only the pages actually sliced are read.
+STORE_SUFFIX = ".cols.npz"
+
+
+def store_path(path):
+    stem, _ = os.path.splitext(path)
+    return stem + STORE_SUFFIX
+
+
+def _source_stamp(path):
+    """(mtime_ns, size) of a source file, recorded in its store at conversion."""
+    st = os.stat(path)
+    return np.asarray([st.st_mtime_ns, st.st_size], dtype=np.int64)
+
+
+def _fresh_store(path):
+    """Return the column store for `path` if it was written from `path` as it is now."""
+    spath = store_path(path)
+    if not os.path.isfile(spath):
+        return None
+    if not os.path.isfile(path):
+        return spath
+    with np.load(spath) as d:
+        if "source" not in d.files:
+            return None
+        fresh = np.array_equal(d["source"], _source_stamp(path))
+    return spath if fresh else None
+
+
+def _memmap_npz(npz_path):
+    """Memory-map every member of an uncompressed npz (no data is read here)."""
+    arrays = {}
+    with zipfile.ZipFile(npz_path) as zf, open(npz_path, "rb") as fh:
+        for info in zf.infolist():
+            key = info.filename[:-4] if info.filename.endswith(".npy") else info.filename
+            if info.compress_type != zipfile.ZIP_STORED:
+                with zf.open(info) as member:   # compressed: cannot map, read it
+                    arrays[key] = np.lib.format.read_array(member, allow_pickle=False)
+                continue
+            fh.seek(info.header_offset)
+            name_len, extra_len = struct.unpack("<HH", fh.read(30)[26:30])
+            fh.seek(info.header_offset + 30 + name_len + extra_len)
+            version = np.lib.format.read_magic(fh)
+            if version == (1, 0):
+                shape, fortran, dtype = np.lib.format.read_array_header_1_0(fh)
+            else:
+                shape, fortran, dtype = np.lib.format.read_array_header_2_0(fh)
+            if dtype.hasobject or 0 in shape:
+                fh.seek(info.header_offset + 30 + name_len + extra_len)
+                arrays[key] = np.lib.format.read_array(fh, allow_pickle=False)
+                continue
+            arrays[key] = np.memmap(fh, dtype=dtype, mode="r", shape=shape,
+                                    order="F" if fortran else "C", offset=fh.tell())
+    return arrays
+
+
+def _window(energy, ewin):
+    """Index selecting energies inside [ewin[0], ewin[1]]; a slice when sorted."""
+    if ewin is None:
+        return slice(None)
+    lo, hi = float(ewin[0]), float(ewin[1])
+    if energy.size < 2 or np.all(energy[1:] >= energy[:-1]):
+        i0 = int(np.searchsorted(energy, lo, side="left"))
+        i1 = int(np.searchsorted(energy, hi, side="right"))
+        return slice(i0, i1)
+    return (energy >= lo) & (energy <= hi)
+
+
+def _pad(idx, n, pad):
+    """Widen a slice by `pad` samples on each side (for interpolation edges)."""
+    if isinstance(idx, slice) and pad:
+        start = 0 if idx.start is None else idx.start
+        stop = n if idx.stop is None else idx.stop
+        return slice(max(start - pad, 0), min(stop + pad, n))
+    return idx
+
+
+def _write_npz(path, arrays):
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as fh:
+        np.savez(fh, **arrays)   # uncompressed, so members stay mappable
+    os.replace(tmp, path)
+
+
+def _narrow(a, dtype):
+    """`a` as `dtype` if that is smaller; never widens (float16 stays float16)."""
+    a = np.asarray(a)
+    if np.dtype(a.dtype).itemsize > np.dtype(dtype).itemsize:
+        return np.ascontiguousarray(a, dtype=dtype)
+    return np.ascontiguousarray(a)
+
+
+def colour_limits(Z):
+    """Robust log-scale (vmin, vmax) of a fuzzy intensity matrix (like your Matplotlib)."""
+    Z = np.asarray(Z, dtype=float)
+    Zpos = Z[Z > 1e-9]
+    vmax = np.percentile(Z, 99.8)
+    vmin = max(np.percentile(Zpos, 5), vmax / 1e4) if Zpos.size else vmax / 1e4
+    return float(vmin), float(vmax)
+
+
+def convert_csv(csv_path, dtype=np.float32):
+    """Write `csv_path` as a column store (one member per column, at most `dtype`)."""
+    df = pd.read_csv(csv_path)
+    arrays = {"columns": np.asarray([str(c) for c in df.columns]),
+              "source": _source_stamp(csv_path)}
+    for i, c in enumerate(df.columns):
+        # energy axis stays float64 so window edges are not shifted by rounding
+        col = df[c].to_numpy()
+        arrays[f"c{i}"] = col.astype(float) if i == 0 else _narrow(col, dtype)
+    out = store_path(csv_path)
+    _write_npz(out, arrays)
+    return out
+
+
+def convert_fuzzy(npz_path, dtype=np.float32):
+    """Rewrite fuzzy_data.npz as a pickle-free, uncompressed column store."""
     d = np.load(npz_path, allow_pickle=True)
-    centres = np.asarray(d["centres"], dtype=float)              # (nE,)
-    Z = np.asarray(d["intensity"], dtype=float)                  # (nE, nK)
-    tick_positions = np.asarray(d.get("tick_positions", np.arange(Z.shape[1])), dtype=float)
-    tick_labels = [str(x) for x in d.get("tick_labels", np.arange(Z.shape[1]))]
-    labels = [str(x) for x in d.get("labels", [])]
+    arrays = {"source": _source_stamp(npz_path)}
+    for key in d.files:
+        a = np.asarray(d[key])
+        if a.dtype.hasobject:
+            a = np.asarray([str(x) for x in a.ravel()]).reshape(a.shape)
+        elif key == "intensity":
+            # colour limits over the full matrix, so trimmed loads keep the same scale
+            arrays["clim"] = np.asarray(colour_limits(a))
+            a = _narrow(a, dtype)
+        arrays[key] = a
+    out = store_path(npz_path)
+    _write_npz(out, arrays)
+    return out
+
+
+def convert_properties(folder, dtype=np.float32):
+    """Convert every *_data.csv / fuzzy_data.npz in `folder`; returns written paths."""
+    written = []
+    for name in sorted(os.listdir(folder)):
+        path = os.path.join(folder, name)
+        if name.endswith("_data.csv"):
+            written.append(convert_csv(path, dtype=dtype))
+        elif name == "fuzzy_data.npz":
+            written.append(convert_fuzzy(path, dtype=dtype))
+    return written
+
+
+def _load_columns(path, ewin=None, pad=0):
+    """(energy, labels, [column arrays]) from the store if fresh, else from CSV."""
+    spath = _fresh_store(path)
+    if spath is not None:
+        d = _memmap_npz(spath)
+        names = [str(x) for x in d["columns"]]
+        energy = np.asarray(d["c0"], dtype=float)
+        idx = _pad(_window(energy, ewin), energy.size, pad)
+        cols = [np.asarray(d[f"c{i}"][idx], dtype=float) for i in range(1, len(names))]
+        return energy[idx], names[1:], cols
+
+    df = pd.read_csv(path)
+    energy = df.iloc[:, 0].to_numpy(dtype=float)
+    idx = _pad(_window(energy, ewin), energy.size, pad)
+    labels = list(df.columns[1:])
+    cols = [df[c].to_numpy(dtype=float)[idx] for c in labels]
+    return energy[idx], labels, cols
+
+
+def load_fuzzy(npz_path, trim=True):
+    spath = _fresh_store(npz_path)
+    d = _memmap_npz(spath) if spath is not None else np.load(npz_path, allow_pickle=True)
+    centres_all = np.asarray(d["centres"], dtype=float)          # (nE,)
+    Z_all = d["intensity"]                                       # memmap when from store
+    nK = Z_all.shape[1]
+    # only the rows inside the plotted window (+1 each side) are pulled from disk
+    win = d["ewin"] if trim and "ewin" in d else None
+    rows = _pad(_window(centres_all, win), centres_all.size, 1)
+    centres = centres_all[rows]
+    Z = np.asarray(Z_all[rows], dtype=float)                     # (nE, nK)
+    # colour scale always comes from the full matrix, not just the trimmed rows
+    clim = tuple(float(x) for x in d["clim"]) if "clim" in d else colour_limits(Z_all)
+    tick_positions = np.asarray(d["tick_positions"] if "tick_positions" in d else np.arange(nK), dtype=float)
+    tick_labels = [str(x) for x in (d["tick_labels"] if "tick_labels" in d else np.arange(nK))]
+    labels = [str(x) for x in (d["labels"] if "labels" in d else [])]
     extent = np.asarray(
-        d.get("extent", [0.0, float(Z.shape[1]-1), float(centres.min()), float(centres.max())]),
+        d["extent"] if "extent" in d
+        else [0.0, float(nK-1), float(centres_all.min()), float(centres_all.max())],
         dtype=float
     )
-    ewin = np.asarray(d.get("ewin", [float(centres.min()), float(centres.max())]), dtype=float)
+    ewin = np.asarray(d["ewin"] if "ewin" in d
+                      else [float(centres_all.min()), float(centres_all.max())], dtype=float)
     return dict(centres=centres, Z=Z,
                 tick_positions=tick_positions, tick_labels=tick_labels,
-                labels=labels, extent=extent, ewin=ewin)
+                labels=labels, extent=extent, ewin=ewin, clim=clim)
 
 
-def load_pdos_csv(csv_path):
-    df = pd.read_csv(csv_path)
-    energy = df.iloc[:, 0].to_numpy(dtype=float)  # Energy_eV
-    labels = list(df.columns[1:])                 # cumulative columns (Ycum)
-    Ycum = df.iloc[:, 1:].to_numpy(dtype=float)   # (nE, nCurves)
+def load_pdos_csv(csv_path, ewin=None):
+    # pad by one sample so interpolation onto the fuzzy grid covers the window edges
+    energy, labels, cols = _load_columns(csv_path, ewin=ewin, pad=1)
+    Ycum = np.column_stack(cols) if cols else np.empty((energy.size, 0))  # (nE, nCurves)
     return energy, labels, Ycum
 
 
-def load_coop_csv(csv_path):
-    df = pd.read_csv(csv_path)
-    Ener = df.iloc[:, 0].to_numpy(dtype=float)     # MO_Energy_eV
-    pairs = list(df.columns[1:])
-    values = {p: df[p].to_numpy(dtype=float) for p in pairs}
+def load_coop_csv(csv_path, ewin=None):
+    Ener, pairs, cols = _load_columns(csv_path, ewin=ewin)
+    if ewin is not None and Ener.size == 0:
+        # nothing in the window: build_combined_figure widens the axis to all sticks
+        return load_coop_csv(csv_path)
+    values = dict(zip(pairs, cols))
     return Ener, pairs, values
 
 
+# ----------------------------- batch loading -----------------------------
+
+def load_properties(folder, pdos="pdos_data.csv", coop="coop_data.csv",
+                    ewin=None, label=None):
+    """PDOS + COOP of one properties/ folder (fuzzy maps are not compared)."""
+    pdos_energy, pdos_labels, pdos_Ycum = load_pdos_csv(os.path.join(folder, pdos), ewin=ewin)
+    coop_energy, coop_pairs, coop_values = load_coop_csv(os.path.join(folder, coop), ewin=ewin)
+    if label is None:
+        # .../CdTe/HLE17/12ang/properties -> "CdTe HLE17 12ang"
+        parts = os.path.normpath(os.path.abspath(folder)).split(os.sep)
+        if parts[-1] == "properties":
+            parts = parts[:-1]
+        label = " ".join(parts[-3:])
+    return dict(label=label,
+                pdos_energy=pdos_energy, pdos_labels=pdos_labels, pdos_Ycum=pdos_Ycum,
+                coop_energy=coop_energy, coop_pairs=coop_pairs, coop_values=coop_values)
+
+
+def load_many(folders, labels=None, max_workers=None, **kwargs):
+    """load_properties for every folder on a thread pool (the work is file I/O)."""
+    labels = list(labels) if labels else [None] * len(folders)
+    if len(labels) != len(folders):
+        raise ValueError("labels must match folders one-to-one")
+    with ThreadPoolExecutor(max_workers=max_workers or min(8, len(folders) or 1)) as pool:
+        futures = [pool.submit(load_properties, f, label=l, **kwargs)
+                   for f, l in zip(folders, labels)]
+        return [fut.result() for fut in futures]
+
+
+def interp_columns(x_new, x, Y, fill=None):
+    """Linear interpolation of every column of Y (nE, nC) from x onto x_new at once.
+
+    Like np.interp per column, except points outside [x[0], x[-1]] get `fill`
+    when it is given (edge values otherwise). `x` must be ascending.
+    """
+    x_new = np.asarray(x_new, dtype=float)
+    x = np.asarray(x, dtype=float)
+    Y = np.asarray(Y, dtype=float)
+    if x.size == 0:
+        # no source samples (e.g. a window outside the data): nothing to interpolate
+        ncols = Y.shape[1] if Y.ndim == 2 else 1
+        return np.full((x_new.size, ncols), np.nan if fill is None else fill)
+    Y = Y.reshape(x.size, -1)
+    if x.size == 1:
+        out = np.repeat(Y, x_new.size, axis=0)
+    else:
+        i = np.clip(np.searchsorted(x, x_new, side="right"), 1, x.size - 1)
+        x0, x1 = x[i - 1], x[i]
+        w = np.clip((x_new - x0) / np.where(x1 > x0, x1 - x0, 1.0), 0.0, 1.0)[:, None]
+        out = Y[i - 1] * (1.0 - w) + Y[i] * w
+    if fill is not None:
+        out[(x_new < x[0]) | (x_new > x[-1])] = fill
+    return out
+
+
+def common_energy_axis(energies):
+    """Union of the energy ranges at the finest median spacing among the inputs."""
+    energies = [np.asarray(e, dtype=float) for e in energies if np.size(e)]
+    if not energies:
+        return np.empty(0)
+    lo = min(float(e[0]) for e in energies)
+    hi = max(float(e[-1]) for e in energies)
+    steps = [float(np.median(np.diff(e))) for e in energies if e.size > 1]
+    step = min(steps) if steps else 0.0
+    if step <= 0 or hi <= lo:
+        return np.array([lo])
+    return np.linspace(lo, hi, int(round((hi - lo) / step)) + 1)
+
+
+def resample_pdos(E, structures):
+    """Every structure's Ycum on the axis E, one interp_columns call per distinct grid.
+
+    Structures sharing a PDOS energy grid (the usual case within a size series)
+    have their columns stacked side by side and interpolated together.
+    """
+    groups = {}
+    for k, s in enumerate(structures):
+        x = np.asarray(s["pdos_energy"], dtype=float)
+        groups.setdefault((x.size, x.tobytes()), []).append(k)
+    out = [None] * len(structures)
+    for ks in groups.values():
+        x = structures[ks[0]]["pdos_energy"]
+        blocks = [np.asarray(structures[k]["pdos_Ycum"], dtype=float) for k in ks]
+        Y = interp_columns(E, x, np.hstack(blocks), fill=np.nan)
+        splits = np.cumsum([b.shape[1] for b in blocks])[:-1]
+        for k, Yk in zip(ks, np.split(Y, splits, axis=1)):
+            out[k] = Yk
+    return out
+
+
 # ----------------------------- plotting core -----------------------------
 
 def build_combined_figure(
@@ -97,9 +382,7 @@ def build_combined_figure(
 
     # ---------------- Fuzzy heatmap (Inferno, robust log, black bg) ----------------
     # robust log normalization (like your Matplotlib)
-    Zpos = Z[Z > 1e-9]
-    vmax = np.percentile(Z, 99.8)
-    vmin = max(np.percentile(Zpos, 5), vmax / 1e4) if Zpos.size else vmax / 1e4
+    vmin, vmax = fuzzy["clim"] if "clim" in fuzzy else colour_limits(Z)
 
     Zm = Z.copy()
     Zm[Zm <= 0] = np.nan
@@ -155,9 +438,7 @@ def build_combined_figure(
     # ---------------- PDOS stacked area (from cumulative Ycum) ----------------
     # Interpolate to fuzzy centres if needed
     if not np.array_equal(pdos_energy, centres):
-        Ycum_use = np.empty((centres.size, pdos_Ycum.shape[1]), dtype=float)
-        for j in range(pdos_Ycum.shape[1]):
-            Ycum_use[:, j] = np.interp(centres, pdos_energy, pdos_Ycum[:, j])
+        Ycum_use = interp_columns(centres, pdos_energy, pdos_Ycum)
     else:
         Ycum_use = pdos_Ycum
 
@@ -299,28 +580,215 @@ def build_combined_figure(
     return fig
 
 
+def build_comparison_figure(
+    structures, ewin=None, ef=None, normalize_coop=False, normalize_dos=False,
+    title="Size series"
+):
+    """One figure comparing PDOS + COOP of several structures (see load_many).
+
+    All DOS curves are resampled onto a common energy axis; both panels share
+    the energy axis, legend entries are grouped per structure and a button row
+    shows all structures or a single one. There is no fuzzy band-map panel.
+    """
+    fig = make_subplots(
+        rows=1, cols=2, shared_yaxes=True,
+        column_widths=[0.6, 0.4],
+        horizontal_spacing=0.06,
+        subplot_titles=("DOS", "COOP sticks"),
+    )
+    fig.update_layout(template="plotly_white",
+                      paper_bgcolor="white", plot_bgcolor="white")
+
+    palette = (go.Figure().layout.template.layout.colorway
+               or ["#636EFA","#EF553B","#00CC96","#AB63FA","#FFA15A",
+                   "#19D3F3","#FF6692","#B6E880","#FF97FF","#FECB52"])
+    dashes = ["solid", "dash", "dot", "dashdot", "longdash", "longdashdot"]
+
+    E = common_energy_axis([s["pdos_energy"] for s in structures])
+    Ys = resample_pdos(E, structures)
+    if ewin is None:
+        ewin = [float(E[0]), float(E[-1])] if E.size else [0.0, 1.0]
+
+    # COOP normalization is global so stick heights stay comparable across sizes
+    coop_masks = [(s["coop_energy"] >= ewin[0]) & (s["coop_energy"] <= ewin[1])
+                  for s in structures]
+    scale = 1.0
+    if normalize_coop:
+        gmax = 0.0
+        for s, m in zip(structures, coop_masks):
+            for p in s["coop_pairs"]:
+                v = s["coop_values"][p][m]
+                if v.size:
+                    gmax = max(gmax, float(np.max(np.abs(v))))
+        scale = (1.0 / gmax) if gmax > 0 else 1.0
+
+    owner = []   # structure index of each trace, for the toggle buttons
+    default_visible = []
+    for k, (s, m, Y) in enumerate(zip(structures, coop_masks, Ys)):
+        label, color = s["label"], palette[k % len(palette)]
+
+        # ---------------- DOS: total + per-species (from cumulative Ycum) ----------------
+        if Y.shape[1]:
+            parts = np.diff(Y, axis=1, prepend=0.0)
+            if normalize_dos:
+                peak = np.nanmax(Y[:, -1]) if np.any(np.isfinite(Y[:, -1])) else 0.0
+                if peak > 0:
+                    Y, parts = Y / peak, parts / peak
+            fig.add_trace(
+                go.Scatter(
+                    x=Y[:, -1], y=E, mode="lines",
+                    line=dict(color=color, width=2),
+                    name=f"{label} total", legendgroup=label,
+                    legendgrouptitle_text=label,
+                    hovertemplate=f"{label}: %{{x:.3f}}<br>E=%{{y:.3f}} eV<extra></extra>",
+                ),
+                row=1, col=1
+            )
+            owner.append(k)
+            default_visible.append(True)
+            for j, lab in enumerate(s["pdos_labels"]):
+                fig.add_trace(
+                    go.Scatter(
+                        x=parts[:, j], y=E, mode="lines",
+                        line=dict(color=color, width=1, dash=dashes[(j + 1) % len(dashes)]),
+                        name=f"{label} {lab}", legendgroup=label,
+                        visible="legendonly",
+                        hovertemplate=f"{label} {lab}: %{{x:.3f}}<br>E=%{{y:.3f}} eV<extra></extra>",
+                    ),
+                    row=1, col=1
+                )
+                owner.append(k)
+                default_visible.append("legendonly")
+
+        # ---------------- COOP sticks, one trace per pair ----------------
+        Ener = s["coop_energy"][m]
+        for j, p in enumerate(s["coop_pairs"]):
+            v = s["coop_values"][p][m] * scale
+            if v.size == 0:
+                continue
+            n = v.size
+            xs = np.column_stack([np.zeros(n), v, np.full(n, np.nan)]).ravel()
+            ys = np.column_stack([Ener, Ener, np.full(n, np.nan)]).ravel()
+            fig.add_trace(
+                go.Scattergl(
+                    x=xs, y=ys, mode="lines",
+                    line=dict(color=color, width=2, dash=dashes[j % len(dashes)]),
+                    name=f"{label} {p}", legendgroup=label,
+                    hoverinfo="skip",
+                ),
+                row=1, col=2
+            )
+            owner.append(k)
+            default_visible.append(True)
+
+    # per-structure toggles: "All" restores the default view
+    buttons = [dict(label="All", method="update", args=[{"visible": default_visible}])]
+    for k, s in enumerate(structures):
+        vis = [v if o == k else False for o, v in zip(owner, default_visible)]
+        buttons.append(dict(label=s["label"], method="update", args=[{"visible": vis}]))
+
+    # axes
+    fig.update_xaxes(title_text="DOS (normalized)" if normalize_dos else "DOS (a.u.)",
+                     title_font=dict(color="black"), rangemode="tozero", row=1, col=1)
+    if normalize_coop:
+        fig.update_xaxes(range=[-1.05, 1.05], title_text="COOP (normalized)",
+                         title_font=dict(color="black"), row=1, col=2)
+    else:
+        fig.update_xaxes(title_text="COOP (a.u.)",
+                         title_font=dict(color="black"), row=1, col=2)
+    for c in (1, 2):
+        fig.update_xaxes(showticklabels=True, ticks="outside",
+                         tickfont=dict(color="black"), row=1, col=c)
+        fig.update_yaxes(
+            title_text="Energy (eV)",
+            title_font=dict(color="black"),
+            range=[ewin[0], ewin[1]],
+            showticklabels=True, ticks="outside",
+            tickfont=dict(color="black"),
+            row=1, col=c
+        )
+        if ef is not None:
+            fig.add_hline(y=float(ef), line_dash="dash", line_color="black", line_width=1.5, row=1, col=c)
+
+    # ---------------- global layout ----------------
+    fig.update_layout(
+        title=dict(text=title, x=0.0),
+        legend=dict(groupclick="togglegroup"),
+        updatemenus=[dict(type="buttons", direction="right", buttons=buttons,
+                          x=0.0, xanchor="left", y=1.08, yanchor="bottom")],
+        margin=dict(l=80, r=40, t=110, b=70),
+        height=800,
+    )
+
+    return fig
+
+
 # ----------------------------- CLI -----------------------------
 
 def main():
     ap = argparse.ArgumentParser()
-    ap.add_argument("--fuzzy", required=True, help="Path to fuzzy_data.npz")
-    ap.add_argument("--pdos",  required=True, help="Path to pdos_data.csv")
-    ap.add_argument("--coop",  required=True, help="Path to coop_data.csv")
+    ap.add_argument("--fuzzy", help="Path to fuzzy_data.npz")
+    ap.add_argument("--pdos",  help="Path to pdos_data.csv")
+    ap.add_argument("--coop",  help="Path to coop_data.csv")
     ap.add_argument("--out",   default="fuzzy_pdos_coop_interactive.html", help="Output HTML")
     ap.add_argument("--normalize-coop", action="store_true", help="Normalize COOP to [-1,1]")
     ap.add_argument("--ef", type=float, default=None, help="Fermi/midgap energy for dashed line")
-    ap.add_argument("--title", type=str, default="Fuzzy Band Map", help="Title for fuzzy panel")
+    ap.add_argument("--title", type=str, default=None,
+                    help="Title for fuzzy panel (figure title with --compare)")
+    ap.add_argument("--compare", metavar="DIR", nargs="+", default=None,
+                    help="Compare PDOS/COOP of several properties/ folders in one figure "
+                         "(no fuzzy panel)")
+    ap.add_argument("--labels", nargs="+", default=None,
+                    help="Legend labels (--compare only)")
+    ap.add_argument("--ewin", type=float, nargs=2, default=None,
+                    help="Energy window in eV (--compare only); default: union of the PDOS grids")
+    ap.add_argument("--normalize-dos", action="store_true",
+                    help="Scale each total DOS to a peak of 1 (--compare only)")
+    ap.add_argument("--convert", metavar="DIR", default=None,
+                    help=f"Write *{STORE_SUFFIX} column stores for the inputs in DIR and exit")
     args = ap.parse_args()
 
+    if args.convert is not None:
+        for path in convert_properties(args.convert):
+            print(f"✓ Wrote column store → {path}")
+        return
+    if args.compare is not None:
+        if args.labels is not None and len(args.labels) != len(args.compare):
+            ap.error("--labels must give one label per --compare folder")
+        if args.ewin is not None and not args.ewin[0] < args.ewin[1]:
+            ap.error("--ewin needs EMIN < EMAX")
+        structures = load_many(args.compare, labels=args.labels, ewin=args.ewin)
+        fig = build_comparison_figure(
+            structures, ewin=args.ewin, ef=args.ef,
+            normalize_coop=args.normalize_coop, normalize_dos=args.normalize_dos,
+            title=args.title or "Size series"
+        )
+        fig.write_html(args.out, include_plotlyjs="cdn", full_html=True)
+        print(f"✓ Wrote comparison HTML → {args.out}")
+        return
+    for flag, value in (("--labels", args.labels), ("--ewin", args.ewin),
+                        ("--normalize-dos", args.normalize_dos)):
+        if value:
+            ap.error(f"{flag} is only valid with --compare")
+    if not (args.fuzzy and args.pdos and args.coop):
+        ap.error("--fuzzy, --pdos and --coop are required unless --convert or --compare is given")
+
+    # Read only the energy window that ends up on screen
     fuzzy = load_fuzzy(args.fuzzy)
-    pdos_energy, pdos_labels, pdos_Ycum = load_pdos_csv(args.pdos)
-    coop_energy, coop_pairs, coop_values = load_coop_csv(args.coop)
+    ewin = fuzzy["ewin"]
+    coop_energy, coop_pairs, coop_values = load_coop_csv(args.coop, ewin=ewin)
+    if coop_energy.size and not np.any((coop_energy >= ewin[0]) & (coop_energy <= ewin[1])):
+        # no sticks in ewin: the y-axes get widened to all sticks, so show every row
+        fuzzy = load_fuzzy(args.fuzzy, trim=False)
+    centres = fuzzy["centres"]
+    pdos_energy, pdos_labels, pdos_Ycum = load_pdos_csv(
+        args.pdos, ewin=(float(centres.min()), float(centres.max())))
 
     fig = build_combined_figure(
         fuzzy, pdos_energy, pdos_labels, pdos_Ycum,
         coop_energy, coop_pairs, coop_values,
         ef=args.ef, normalize_coop=args.normalize_coop,
-        title=args.title
+        title=args.title or "Fuzzy Band Map"
     )
     fig.write_html(args.out, include_plotlyjs="cdn", full_html=True)
     print(f"✓ Wrote interactive HTML → {args.out}")